@@ -61,7 +61,6 @@ static flags = {
       const githubService = new GitHubService();
       const projectParser = new ProjectParser();
       const directoryManager = new DirectoryManager();
-      const vscodeService = new VSCodeService();
 
       // Parse and validate project tag
       this.log(`🔍 Parsing project tag: ${args.projectTag}`);
@@ -138,6 +137,8 @@ static flags = {
       if (flags.vscode) {
         this.log(`💻 Opening in VS Code...`);
 
+        const vscodeService = new VSCodeService();
+
         // Create a minimal ProjectInfo object for the cloned project
         const projectInfo = {
           lastModified: new Date(),
@@ -63,11 +63,6 @@ static flags = {
     const { args, flags } = await this.parse(ProjectCreate);
 
     try {
-      // Initialize services
-      const githubService = new GitHubService();
-      const directoryManager = new DirectoryManager();
-      const vscodeService = new VSCodeService();
-
       const projectName = args.name;
 
       // Validate project name
@@ -84,6 +79,7 @@ static flags = {
       if (flags.github) {
         this.log(`📡 Creating GitHub repository...`);
 
+        const githubService = new GitHubService();
         const createResult = await githubService.createRepository({
           description: flags.description,
           name: projectName,
@@ -106,7 +102,7 @@ static flags = {
         this.log(`📁 Initializing local project structure...`);
 
         // Create project directory
-        const projectPath = await this.createProjectStructure(projectName, directoryManager);
+        const projectPath = await this.createProjectStructure(projectName, new DirectoryManager());
 
         // Initialize git repository if GitHub repo was created
         if (createdRepository) {
@@ -122,6 +118,7 @@ static flags = {
         if (flags.vscode) {
           this.log(`💻 Opening in VS Code...`);
 
+          const vscodeService = new VSCodeService();
           const projectInfo = {
             lastModified: new Date(),
             name: projectName,
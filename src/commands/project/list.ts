@@ -6,6 +6,18 @@ import {ProjectDiscoveryService} from '../../lib/project-discovery.js'
 import {VSCodeService} from '../../lib/vscode-service.js'
 import {HierarchyDisplayOptions, ProjectCodeConfig, ProjectHierarchyNode, ProjectInfo, ProjectType} from '../../types/index.js'
 
+type ProjectSortField = NonNullable<ProjectCodeConfig['ui']>['sortBy']
+
+/**
+ * Project comparators keyed by the configured sort field
+ */
+const PROJECT_COMPARATORS: Record<ProjectSortField, (a: ProjectInfo, b: ProjectInfo) => number> = {
+  name: (a, b) => a.name.localeCompare(b.name),
+  path: (a, b) => a.path.localeCompare(b.path),
+  type: (a, b) => a.type.localeCompare(b.type),
+  updatedAt: (a, b) => a.lastModified.getTime() - b.lastModified.getTime(),
+}
+
 /**
  * List discovered projects
  */
@@ -19,6 +31,7 @@ static examples = [
     '<%= config.bin %> <%= command.id %> --tree',
     '<%= config.bin %> <%= command.id %> --hierarchy --parent ~/code/work',
     '<%= config.bin %> <%= command.id %> --depth 3',
+    '<%= config.bin %> <%= command.id %> --refresh',
   ]
 static flags = {
     depth: Flags.integer({
@@ -45,6 +58,10 @@ static flags = {
       char: 'p',
       description: 'Filter projects by parent directory',
     }),
+    refresh: Flags.boolean({
+      default: false,
+      description: 'Rescan project folders instead of using cached results',
+    }),
     search: Flags.string({
       char: 's',
       description: 'Search projects by name or path',
@@ -128,6 +145,7 @@ static flags = {
 
       const discoveryOptions = {
         maxDepth: flags['max-depth'],
+        useCache: !flags.refresh,
       }
 
       const projects = await projectDiscovery.discoverProjects(discoveryOptions)
@@ -166,51 +184,24 @@ static flags = {
       }
 
       // Sort projects
-      filteredProjects.sort((a, b) => {
-        const config = configManager.getConfig()
-        const sortBy = config?.ui?.sortBy || 'name'
-        const sortOrder = config?.ui?.sortOrder || 'asc'
-
-        let comparison = 0
-
-        switch (sortBy) {
-          case 'name': {
-            comparison = a.name.localeCompare(b.name)
-            break
-          }
-
-          case 'path': {
-            comparison = a.path.localeCompare(b.path)
-            break
-          }
-
-          case 'type': {
-            comparison = a.type.localeCompare(b.type)
-            break
-          }
-
-          case 'updatedAt': {
-            comparison = a.lastModified.getTime() - b.lastModified.getTime()
-            break
-          }
-
-          default: {
-            comparison = a.name.localeCompare(b.name)
-          }
-        }
-
-        return sortOrder === 'desc' ? -comparison : comparison
-      })
+      const config = configManager.getConfig()
+      const sortBy = config?.ui?.sortBy || 'name'
+      const sortOrder = config?.ui?.sortOrder || 'asc'
+
+      // Pick the comparator once rather than switching on the sort field for every comparison
+      const compare = PROJECT_COMPARATORS[sortBy] || PROJECT_COMPARATORS.name
+      const direction = sortOrder === 'desc' ? -1 : 1
+      filteredProjects.sort((a, b) => direction * compare(a, b))
 
       // Display results
       if (flags.format === 'json') {
         this.log(JSON.stringify(filteredProjects, null, 2))
       } else if (hierarchyOptions.showTree) {
-        this.displayProjectsTree(filteredProjects, hierarchyOptions)
+        this.displayProjectsTree(projectDiscovery, filteredProjects, hierarchyOptions)
       } else if (hierarchyOptions.showLevels) {
-        this.displayProjectsHierarchyTable(filteredProjects, hierarchyOptions, configManager.getConfig())
+        this.displayProjectsHierarchyTable(projectDiscovery, filteredProjects, hierarchyOptions, config)
       } else {
-        this.displayProjectsTable(filteredProjects, configManager.getConfig() || {} as ProjectCodeConfig)
+        this.displayProjectsTable(filteredProjects, config || {} as ProjectCodeConfig)
       }
 
       // Show VS Code integration status
@@ -266,13 +257,12 @@ static flags = {
   /**
    * Display projects in hierarchy-aware table format
    */
-  private displayProjectsHierarchyTable(projects: ProjectInfo[], options: HierarchyDisplayOptions, config: unknown): void {
+  private displayProjectsHierarchyTable(projectDiscoveryService: ProjectDiscoveryService, projects: ProjectInfo[], options: HierarchyDisplayOptions, config: unknown): void {
     this.log('')
     this.log('📊 Projects (Hierarchy View)')
     this.log('')
 
     // Build hierarchy and apply options
-    const projectDiscoveryService = new ProjectDiscoveryService()
     const hierarchyNodes = projectDiscoveryService.buildProjectHierarchy(projects)
     const filteredNodes = projectDiscoveryService.applyHierarchyOptions(hierarchyNodes, options)
 
@@ -327,13 +317,12 @@ static flags = {
   /**
    * Display projects in tree format
    */
-  private displayProjectsTree(projects: ProjectInfo[], options: HierarchyDisplayOptions): void {
+  private displayProjectsTree(projectDiscoveryService: ProjectDiscoveryService, projects: ProjectInfo[], options: HierarchyDisplayOptions): void {
     this.log('')
     this.log('🌳 Projects (Tree View)')
     this.log('')
 
     // Build hierarchy
-    const projectDiscoveryService = new ProjectDiscoveryService()
     const hierarchyNodes = projectDiscoveryService.buildProjectHierarchy(projects)
 
     // Apply parent filter if specified
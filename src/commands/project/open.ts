@@ -34,6 +34,10 @@ static flags = {
       default: true,
       description: 'Open in a new VS Code window',
     }),
+    refresh: Flags.boolean({
+      default: false,
+      description: 'Rescan project folders instead of using cached results',
+    }),
     search: Flags.string({
       char: 's',
       description: 'Open projects matching search query',
@@ -107,18 +111,12 @@ static flags = {
         return;
       }
 
-      // Check VS Code availability
-      const vscodeDetectResult = await vscodeService.detectVSCode();
-      if (!vscodeDetectResult.success) {
-        this.error('VS Code not detected. Please install VS Code to use this feature.');
-        return;
-      }
-
-      this.log(`💡 VS Code detected (${vscodeDetectResult.data!.version})`);
+      // Start VS Code detection now so it overlaps with discovery
+      const vscodeDetection = vscodeService.detectVSCode();
 
       // Discover projects
       this.log('🔍 Discovering projects...');
-      const projects = await projectDiscovery.discoverProjects();
+      const projects = await projectDiscovery.discoverProjects({ useCache: !flags.refresh });
 
       if (projects.length === 0) {
         this.log('No projects found.');
@@ -151,7 +149,12 @@ static flags = {
         projectsToOpen = [specificProject];
         this.log(`Opening project: ${specificProject.name}`);
       } else {
-        // Interactive selection (fallback)
+        // Interactive selection (fallback), only once VS Code is known to be available
+        if (!(await vscodeDetection).success) {
+          this.error('VS Code not detected. Please install VS Code to use this feature.');
+          return;
+        }
+
         projectsToOpen = await this.selectProjectsInteractively(projects);
       }
 
@@ -160,6 +163,15 @@ static flags = {
         return;
       }
 
+      // Check VS Code availability only once there is something to open
+      const vscodeDetectResult = await vscodeDetection;
+      if (!vscodeDetectResult.success) {
+        this.error('VS Code not detected. Please install VS Code to use this feature.');
+        return;
+      }
+
+      this.log(`💡 VS Code detected (${vscodeDetectResult.data!.version})`);
+
       // Open projects
       if (projectsToOpen.length === 1) {
         // Open single project
@@ -549,6 +549,9 @@ export class AuthService {
         }
       }
     }, 300_000) // Check every 5 minutes
+
+    // Don't keep the process alive once the command has finished
+    this.tokenValidationTimer.unref()
   }
 
   /**
@@ -1,9 +1,34 @@
-import { existsSync, readFileSync, writeFileSync } from 'node:fs';
+import { mkdirSync, readFileSync, renameSync, unlinkSync, writeFileSync } from 'node:fs';
 import { homedir } from 'node:os';
-import { join, resolve } from 'node:path';
+import { dirname, join, resolve } from 'node:path';
 
 import { CommandResult, ProjectCodeConfig } from '../types/index.js';
 
+/**
+ * Home directory, resolved once per process
+ */
+let homeDirectory: null | string = null;
+
+/**
+ * Expand a leading ~ in a configured path to the user's home directory
+ * Other users' homes (~user) are not expanded
+ */
+export function expandHomePath(path: string): string {
+  if (path !== '~' && !path.startsWith('~/') && !path.startsWith('~\\')) {
+    return path;
+  }
+
+  homeDirectory ??= homedir();
+  return join(homeDirectory, path.slice(2));
+}
+
+/**
+ * Reset the cached home directory
+ */
+export function resetHomeDirectoryCache(): void {
+  homeDirectory = null;
+}
+
 /**
  * Configuration management for ProjectCode CLI
  */
@@ -11,6 +36,8 @@ export class ConfigManager {
   private static instance: ConfigManager;
   private config: null | ProjectCodeConfig = null;
   private configPath: string;
+  private loadError: null | string = null;
+  private savedContent: null | string = null;
 
   private constructor() {
     this.configPath = join(homedir(), '.project-code', 'config.json');
@@ -25,9 +52,14 @@ export class ConfigManager {
   }
 
   /**
-   * Get current configuration
+   * Get current configuration, loading it on first access
+   * A failed load isn't retried on every call, use loadConfig() to retry and getLoadError() for the reason
    */
   public getConfig(): null | ProjectCodeConfig {
+    if (!this.config && this.loadError === null) {
+      this.loadConfig();
+    }
+
     return this.config;
   }
 
@@ -38,12 +70,27 @@ export class ConfigManager {
     return this.configPath;
   }
 
+  /**
+   * Get the error from the last failed configuration load, or null if it succeeded
+   */
+  public getLoadError(): null | string {
+    return this.loadError;
+  }
+
   /**
    * Load configuration from file
    */
   public loadConfig(): CommandResult<ProjectCodeConfig> {
+    this.loadError = null;
     try {
-      if (!existsSync(this.configPath)) {
+      let configData: string;
+      try {
+        configData = readFileSync(this.configPath, 'utf8');
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+          throw error;
+        }
+
         // Create default config if it doesn't exist
         this.config = this.getDefaultConfig();
         this.saveConfig();
@@ -54,7 +101,7 @@ export class ConfigManager {
         };
       }
 
-      const configData = readFileSync(this.configPath, 'utf8');
+      this.savedContent = configData;
       const loadedConfig = JSON.parse(configData) as ProjectCodeConfig;
 
       // Merge with defaults to ensure all properties exist
@@ -65,8 +112,9 @@ export class ConfigManager {
         success: true,
       };
     } catch (error) {
+      this.loadError = `Failed to load configuration: ${error instanceof Error ? error.message : String(error)}`;
       return {
-        error: `Failed to load configuration: ${error instanceof Error ? error.message : String(error)}`,
+        error: this.loadError,
         success: false,
       };
     }
@@ -100,13 +148,30 @@ export class ConfigManager {
     try {
       const configToSave = config || this.config || this.getDefaultConfig();
 
-      // Ensure config directory exists
-      const configDir = join(homedir(), '.project-code');
-      if (!existsSync(configDir)) {
-        // We'll need to create the directory - for now just save to the path
+      // Skip the write when the file already holds exactly this content
+      const content = JSON.stringify(configToSave, null, 2);
+      if (content !== this.savedContent) {
+        // Ensure config directory exists
+        mkdirSync(dirname(this.configPath), { recursive: true });
+
+        // Write to a temporary file and rename it into place so a crash can't leave a partial config
+        const tempPath = `${this.configPath}.${process.pid}.tmp`;
+        try {
+          writeFileSync(tempPath, content, 'utf8');
+          renameSync(tempPath, this.configPath);
+        } catch (error) {
+          try {
+            unlinkSync(tempPath);
+          } catch {
+            // Temporary file was never created
+          }
+
+          throw error;
+        }
+
+        this.savedContent = content;
       }
 
-      writeFileSync(this.configPath, JSON.stringify(configToSave, null, 2), 'utf8');
       this.config = configToSave;
 
       return {
@@ -188,7 +253,7 @@ export class ConfigManager {
 
       // Validate root folders exist or can be created
       for (const folder of config.rootFolders) {
-        const resolvedPath = resolve(folder);
+        const resolvedPath = resolve(expandHomePath(folder));
         // Path validation - ensure it's absolute and reasonable
         if (!resolvedPath.startsWith(homedir()) && !/^[A-Za-z]:\/$/.test(resolvedPath)) {
           return {
@@ -2,11 +2,13 @@
  * Directory hierarchy management service for Project Code CLI
  */
 
+import type { Dirent } from 'node:fs';
+
 import fs from 'node:fs';
 import { dirname, join, resolve } from 'node:path';
 
 import { CommandResult } from '../types/index.js';
-import { ConfigManager } from './config.js';
+import { ConfigManager, expandHomePath } from './config.js';
 
 export interface DirectoryCreationOptions {
   path: string;
@@ -358,32 +360,38 @@ export class DirectoryManager {
     let size = 0;
     let fileCount = 0;
 
-    try {
-      const entries = await this.getDirectoryEntries(path);
+    // Iterative walk using Dirent types, so only files need a stat for their size
+    // Symlinks are counted when they resolve to files, symlinked directories aren't followed
+    const pending = [path];
 
-      for (const entry of entries) {
-        if (entry === '.' || entry === '..') {
-          continue;
-        }
+    while (pending.length > 0) {
+      const currentPath = pending.pop()!;
+      let entries: Dirent[];
+
+      try {
+        entries = await fs.promises.readdir(currentPath, { withFileTypes: true });
+      } catch {
+        // Error reading directory
+        continue;
+      }
 
-        const entryPath = join(path, entry);
-        try {
-          const stats = await fs.promises.stat(entryPath);
-
-          if (stats.isDirectory()) {
-            const subDirInfo = await this.calculateDirectorySize(entryPath);
-            size += subDirInfo.size;
-            fileCount += subDirInfo.fileCount;
-          } else if (stats.isFile()) {
-            size += stats.size;
-            fileCount++;
+      for (const entry of entries) {
+        const entryPath = join(currentPath, entry.name);
+
+        if (entry.isDirectory()) {
+          pending.push(entryPath);
+        } else if (entry.isFile() || entry.isSymbolicLink()) {
+          try {
+            const stats = await fs.promises.stat(entryPath);
+            if (stats.isFile()) {
+              size += stats.size;
+              fileCount++;
+            }
+          } catch {
+            // Skip entries that can't be accessed
           }
-        } catch {
-          // Skip entries that can't be accessed
         }
       }
-    } catch {
-      // Error reading directory
     }
 
     return { fileCount, size };
@@ -394,7 +402,7 @@ export class DirectoryManager {
    */
   private getDefaultRootFolder(): string {
     const config = this.configManager.getConfig();
-    return config?.defaultRootFolder || join(process.env.HOME || '~', 'code');
+    return expandHomePath(config?.defaultRootFolder || '~/code');
   }
 
   /**
@@ -9,7 +9,7 @@ import { join, resolve } from 'node:path';
 
 import { CommandResult } from '../types/index.js';
 import { AuthService } from './auth-service.js';
-import { ConfigManager } from './config.js';
+import { ConfigManager, expandHomePath } from './config.js';
 
 /**
  * Utility function to make HTTP requests using Node.js built-in https module
@@ -264,7 +264,7 @@ export class GitHubService {
    */
   private buildProjectPath(owner: string, repo: string): string {
     const config = this.configManager.getConfig();
-    const rootFolder = config?.defaultRootFolder || join(process.env.HOME || '~', 'code');
+    const rootFolder = expandHomePath(config?.defaultRootFolder || '~/code');
 
     return resolve(join(rootFolder, owner, repo));
   }
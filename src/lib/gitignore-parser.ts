@@ -17,6 +17,7 @@ export class GitignoreParser {
   private static readonly DIRECTORY_SEPARATOR = '/';
   private static readonly NEGATION_PREFIX = '!';
   private static readonly PATTERN_SEPARATORS = /[\/\\]/;
+  private static readonly regexCache = new Map<string, RegExp>();
 
   /**
    * Find all .gitignore files in a directory tree
@@ -176,6 +177,19 @@ export class GitignoreParser {
     }
   }
 
+  /**
+   * Get a compiled pattern regex, compiling it only the first time it is needed
+   */
+  private static getCachedRegex(cacheKey: string, compile: () => RegExp): RegExp {
+    let regex = this.regexCache.get(cacheKey);
+    if (!regex) {
+      regex = compile();
+      this.regexCache.set(cacheKey, regex);
+    }
+
+    return regex;
+  }
+
   /**
    * Match directory patterns (patterns ending with /)
    */
@@ -198,7 +212,7 @@ export class GitignoreParser {
    * Match double wildcard patterns (**)
    */
   private static matchDoubleWildcard(path: string, pattern: string): boolean {
-    const regex = this.patternToRegex(pattern);
+    const regex = this.getCachedRegex(`**:${pattern}`, () => this.patternToRegex(pattern));
     return regex.test(path);
   }
 
@@ -223,7 +237,7 @@ export class GitignoreParser {
    * Match simple wildcard patterns (* and ?)
    */
   private static matchSimpleWildcard(path: string, pattern: string): boolean {
-    const regex = this.simplePatternToRegex(pattern);
+    const regex = this.getCachedRegex(`*:${pattern}`, () => this.simplePatternToRegex(pattern));
     return regex.test(path);
   }
 
@@ -278,12 +292,13 @@ export class GitignoreParser {
       return null;
     }
 
+    // Normalize once here rather than on every path the pattern is matched against
     return {
       directory: baseDir,
       lineNumber,
       negated: isNegated,
       originalLine: line,
-      pattern: patternText,
+      pattern: this.normalizePattern(patternText),
     };
   }
 
@@ -295,16 +310,16 @@ export class GitignoreParser {
     pattern: GitignorePattern,
     options: GitignoreOptions
   ): boolean {
+    // Patterns are already normalized by parsePattern
     const normalizedPath = this.normalizePath(filePath);
-    const normalizedPattern = this.normalizePattern(pattern.pattern);
 
     // Handle directory patterns
     if (pattern.pattern.endsWith(this.DIRECTORY_SEPARATOR)) {
-      return this.matchDirectoryPattern(normalizedPath, normalizedPattern);
+      return this.matchDirectoryPattern(normalizedPath, pattern.pattern);
     }
 
     // Handle glob patterns
-    return this.matchGlobPattern(normalizedPath, normalizedPattern, options);
+    return this.matchGlobPattern(normalizedPath, pattern.pattern, options);
   }
 
   /**
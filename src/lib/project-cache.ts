@@ -0,0 +1,118 @@
+import { createHash } from 'node:crypto';
+import { mkdirSync, readFileSync, renameSync, statSync, unlinkSync, writeFileSync } from 'node:fs';
+import { homedir } from 'node:os';
+import { dirname, join, relative } from 'node:path';
+
+import { CachedProjectInfo, ProjectCacheEntry, ProjectInfo } from '../types/index.js';
+
+const CACHE_VERSION = 3;
+
+/**
+ * Persistent cache for project discovery results
+ * Lets repeated invocations skip the directory scan while no scanned directory or package.json has changed
+ */
+export class ProjectCacheManager {
+  private cachePath: string;
+
+  constructor(cachePath: string = join(homedir(), '.project-code', 'projects-cache.json')) {
+    this.cachePath = cachePath;
+  }
+
+  /**
+   * Remove the cache file
+   */
+  clear(): void {
+    try {
+      unlinkSync(this.cachePath);
+    } catch {
+      // Nothing cached
+    }
+  }
+
+  /**
+   * Build a cache key from the discovery settings and the scanned root folders
+   */
+  createKey(rootFolders: string[], settings: unknown): string {
+    return createHash('sha256')
+      .update(JSON.stringify({ rootFolders, settings }))
+      .digest('hex');
+  }
+
+  /**
+   * Get cached projects for a key, or null if the cache is missing or stale
+   *
+   * The cache is stale once any watched path (every directory the scan read and each
+   * project's package.json) has a different mtime, which costs one stat per path
+   * instead of a readdir and analysis per directory.
+   */
+  get(key: string): null | ProjectInfo[] {
+    try {
+      const entry = JSON.parse(readFileSync(this.cachePath, 'utf8')) as ProjectCacheEntry;
+
+      if (entry.version !== CACHE_VERSION || entry.key !== key) {
+        return null;
+      }
+
+      for (const [watchedPath, mtimeMs] of Object.entries(entry.watchedPaths)) {
+        if (this.getMtime(watchedPath) !== mtimeMs) {
+          return null;
+        }
+      }
+
+      return entry.projects.map(project => ({
+        ...project,
+        lastModified: new Date(project.lastModified),
+        relativePath: relative(process.cwd(), project.path),
+      }));
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Get the cache file path
+   */
+  getCachePath(): string {
+    return this.cachePath;
+  }
+
+  /**
+   * Cache discovered projects under a key, along with the mtimes of the paths that validate them
+   */
+  set(key: string, projects: ProjectInfo[], watchedPaths: Map<string, number>): void {
+    // Store timestamps as epoch milliseconds, which JSON.parse yields directly as numbers
+    // instead of ISO strings that need date parsing, and drop the cwd-relative path
+    const cachedProjects: CachedProjectInfo[] = projects.map(({ lastModified, relativePath: _relativePath, ...project }) => ({
+      ...project,
+      lastModified: lastModified.getTime(),
+    }));
+
+    const entry: ProjectCacheEntry = {
+      key,
+      projects: cachedProjects,
+      version: CACHE_VERSION,
+      watchedPaths: Object.fromEntries(watchedPaths),
+    };
+
+    try {
+      // Rename into place so concurrent invocations never read a partially written cache
+      const tempPath = `${this.cachePath}.${process.pid}.tmp`;
+      mkdirSync(dirname(this.cachePath), { recursive: true });
+      writeFileSync(tempPath, JSON.stringify(entry), 'utf8');
+      renameSync(tempPath, this.cachePath);
+    } catch {
+      // Caching is best effort, discovery results are still returned
+    }
+  }
+
+  /**
+   * Get the modification time of a path in milliseconds, or 0 if it can't be read
+   */
+  private getMtime(path: string): number {
+    try {
+      return statSync(path).mtimeMs;
+    } catch {
+      return 0;
+    }
+  }
+}
@@ -1,5 +1,6 @@
-import { existsSync, readdirSync, readFileSync, statSync } from 'node:fs';
-import { join, relative, sep } from 'node:path';
+import { existsSync, statSync } from 'node:fs';
+import { readdir, readFile, stat } from 'node:fs/promises';
+import { join, relative, resolve, sep } from 'node:path';
 
 import {
   GitignoreMatchResult,
@@ -11,11 +12,15 @@ import {
   ProjectInfo,
   ProjectType,
 } from '../types/index.js';
-import { ConfigManager } from './config.js';
+import { ConfigManager, expandHomePath } from './config.js';
 import { getDefaultCache } from './gitignore-cache.js';
 import { GitignoreParser } from './gitignore-parser.js';
+import { ProjectCacheManager } from './project-cache.js';
 
-
+/**
+ * Directory names that are never scanned for projects
+ */
+const DEFAULT_EXCLUDED_DIRECTORIES = new Set(['.git', '.next', '.nuxt', '.nyc_output', 'bin', 'build', 'coverage', 'dist', 'node_modules', 'obj', 'target']);
 
 /**
  * Project discovery service for scanning and identifying code projects
@@ -90,35 +95,70 @@ export class ProjectDiscoveryService {
       throw new Error('Configuration not loaded');
     }
 
-    const rootFolders = options?.rootFolders || config.rootFolders;
+    const rootFolders = this.normalizeRootFolders(options?.rootFolders || config.rootFolders);
     const maxDepth = options?.maxDepth || config.project?.maxDepth || 5;
     const excludePatterns = options?.excludePatterns || config.project?.excludePatterns || [];
     const includePatterns = options?.includePatterns || config.project?.includePatterns || [];
     const supportedTypes = options?.supportedTypes || config.project?.supportedTypes || [];
     const gitignoreOptions = options?.gitignore || config.project?.gitignore;
+    const existingRootFolders = rootFolders.filter(rootFolder => existsSync(rootFolder));
+
+    // Reuse the previous scan while settings and scanned folders are unchanged
+    const cacheManager = new ProjectCacheManager();
+    const cacheKey = cacheManager.createKey(existingRootFolders, {
+      excludePatterns,
+      gitignoreOptions,
+      includePatterns,
+      maxDepth,
+      supportedTypes,
+    });
+
+    if (options?.useCache !== false) {
+      const cachedProjects = cacheManager.get(cacheKey);
+      if (cachedProjects) {
+        return cachedProjects;
+      }
+    }
 
     const projects: ProjectInfo[] = [];
+    const watchedPaths = new Map<string, number>();
+
+    // Compile exclude globs once instead of for every scanned path
+    const excludeMatchers = excludePatterns.map(pattern => new RegExp(this.globToRegex(pattern)));
 
-    const scanPromises = rootFolders
-      .filter(rootFolder => existsSync(rootFolder))
+    // Roots nested inside another root get their own full scan, so parent scans skip them
+    const scannedRootFolders = new Set(existingRootFolders);
+
+    const scanPromises = existingRootFolders
       .map(rootFolder =>
         this.scanDirectory(
           rootFolder,
           rootFolder,
           0,
           maxDepth,
-          excludePatterns,
+          excludeMatchers,
+          watchedPaths,
+          scannedRootFolders,
           includePatterns,
           supportedTypes,
           gitignoreOptions as GitignoreOptions
         )
       );
 
+    // Guard against a project being reported by more than one root, keep the first occurrence
+    const seenPaths = new Set<string>();
     const projectArrays = await Promise.all(scanPromises);
     for (const folderProjects of projectArrays) {
-      projects.push(...folderProjects);
+      for (const project of folderProjects) {
+        if (!seenPaths.has(project.path)) {
+          seenPaths.add(project.path);
+          projects.push(project);
+        }
+      }
     }
 
+    cacheManager.set(cacheKey, projects, watchedPaths);
+
     return projects;
   }
 
@@ -205,7 +245,12 @@ export class ProjectDiscoveryService {
   /**
    * Analyze a directory to determine if it's a project
    */
-  private async analyzeDirectory(directoryPath: string, files: string[]): Promise<null | ProjectInfo> {
+  private async analyzeDirectory(
+    directoryPath: string,
+    files: string[],
+    lastModified: Date,
+    watchedPaths: Map<string, number>
+  ): Promise<null | ProjectInfo> {
     const fileNames = files.map(f => f.toLowerCase());
 
     // Skip directories that don't contain any project indicators
@@ -214,32 +259,27 @@ export class ProjectDiscoveryService {
       return null;
     }
 
-    const projectType = this.determineProjectType(files, directoryPath);
+    const hasPackageJson = fileNames.includes('package.json');
+    const [projectType] = await Promise.all([
+      this.determineProjectType(fileNames, directoryPath),
+      // package.json edits change the detected type without touching the directory mtime
+      hasPackageJson ? this.watchPath(join(directoryPath, 'package.json'), watchedPaths) : undefined,
+    ]);
     const relativePath = relative(process.cwd(), directoryPath);
 
-    // Get directory stats
-    const size = 0;
-    const fileCount = 0;
-
-    try {
-      // const stats = this.getDirectoryStats(directoryPath);
-      // size = stats.size;
-      // fileCount = stats.fileCount;
-    } catch {
-      // If we can't get stats, continue with zero values
-    }
-
+    // Size and file count are not collected during discovery: walking every
+    // file of every project dominates scan time for a value nothing displays
     const projectInfo: ProjectInfo = {
-      fileCount,
-      hasPackageJson: fileNames.includes('package.json'),
+      fileCount: 0,
+      hasPackageJson,
       hasTsConfig: fileNames.includes('tsconfig.json'),
       hasVSCodeSettings: fileNames.includes('.vscode'),
       isGitRepo: fileNames.includes('.git'),
-      lastModified: this.getLastModifiedTime(directoryPath),
+      lastModified,
       name: this.getProjectName(directoryPath),
       path: directoryPath,
       relativePath,
-      size,
+      size: 0,
       type: projectType,
     };
 
@@ -249,7 +289,7 @@ export class ProjectDiscoveryService {
   /**
    * Check if path is excluded by gitignore patterns
    */
-  private checkGitignore(path: string, gitignoreOptions: GitignoreOptions): GitignoreMatchResult {
+  private checkGitignore(path: string, gitignoreOptions: GitignoreOptions, watchedPaths: Map<string, number>): GitignoreMatchResult {
     if (!gitignoreOptions.enabled) {
       return { excluded: false };
     }
@@ -266,6 +306,15 @@ export class ProjectDiscoveryService {
     // Parse and cache gitignore files
     const allPatterns: GitignorePattern[] = [];
     for (const gitignorePath of gitignorePaths) {
+      // .gitignore edits change exclusions without touching the directory mtime
+      if (!watchedPaths.has(gitignorePath)) {
+        try {
+          watchedPaths.set(gitignorePath, statSync(gitignorePath).mtimeMs);
+        } catch {
+          // Unreadable paths are not watched
+        }
+      }
+
       let gitignoreFile = cacheManager.get(gitignorePath);
 
       if (!gitignoreFile) {
@@ -296,11 +345,11 @@ export class ProjectDiscoveryService {
   /**
    * Determine Node.js project type based on package.json dependencies
    */
-  private determineNodeProjectType(files: string[], directoryPath: string): ProjectType {
+  private async determineNodeProjectType(files: string[], directoryPath: string): Promise<ProjectType> {
     const packageJsonPath = join(directoryPath, 'package.json');
 
     try {
-      const packageContent = JSON.parse(readFileSync(packageJsonPath, 'utf8'));
+      const packageContent = JSON.parse(await readFile(packageJsonPath, 'utf8'));
       const deps = { ...packageContent.dependencies, ...packageContent.devDependencies };
 
       if (deps.typescript) return 'typescript';
@@ -321,14 +370,12 @@ export class ProjectDiscoveryService {
 
 
   /**
-   * Get project type based on file patterns
+   * Get project type based on lowercased file names
    */
-  private determineProjectType(files: string[], directoryPath: string): ProjectType {
-    const fileNames = files.map(f => f.toLowerCase());
-
+  private async determineProjectType(fileNames: string[], directoryPath: string): Promise<ProjectType> {
     // Check for Node.js/JavaScript/TypeScript projects
     if (fileNames.includes('package.json')) {
-      return this.determineNodeProjectType(files, directoryPath);
+      return this.determineNodeProjectType(fileNames, directoryPath);
     }
 
     // Check for Python projects
@@ -406,49 +453,6 @@ export class ProjectDiscoveryService {
     }
   }
 
-  /**
-   * Get directory statistics
-   */
-  private getDirectoryStats(directoryPath: string): { fileCount: number; size: number; } {
-    let size = 0;
-    let fileCount = 0;
-
-    const scan = (currentPath: string) => {
-      try {
-        const entries = readdirSync(currentPath, { withFileTypes: true });
-
-        for (const entry of entries) {
-          const entryPath = join(currentPath, entry.name);
-
-          if (entry.isFile()) {
-            const stat = statSync(entryPath);
-            size += stat.size;
-            fileCount++;
-          } else if (entry.isDirectory() && !entry.name.startsWith('.') && entry.name !== 'node_modules' && entry.name !== 'dist' && entry.name !== 'build') {
-            scan(entryPath);
-          }
-        }
-      } catch {
-        // Skip directories that can't be read
-      }
-    };
-
-    scan(directoryPath);
-    return { fileCount, size };
-  }
-
-  /**
-   * Get last modified time of directory
-   */
-  private getLastModifiedTime(directoryPath: string): Date {
-    try {
-      const stat = statSync(directoryPath);
-      return stat.mtime;
-    } catch {
-      return new Date();
-    }
-  }
-
   /**
    * Helper method to get maximum depth of a node
    */
@@ -534,6 +538,14 @@ export class ProjectDiscoveryService {
            files.some(f => f.endsWith('.rs') && f !== '.gitignore');
   }
 
+  /**
+   * Normalize root folders and drop exact duplicates so each folder is scanned once
+   * Nested roots are kept, since the parent scan may not reach them (depth limit or exclusions)
+   */
+  private normalizeRootFolders(rootFolders: string[]): string[] {
+    return [...new Set(rootFolders.map(rootFolder => resolve(expandHomePath(rootFolder))))];
+  }
+
   /**
    * Scan a directory for projects
    */
@@ -542,7 +554,9 @@ export class ProjectDiscoveryService {
     currentPath: string,
     currentDepth: number,
     maxDepth: number,
-    excludePatterns: string[],
+    excludeMatchers: RegExp[],
+    watchedPaths: Map<string, number>,
+    rootFolders: Set<string>,
     includePatterns: string[],
     supportedTypes: ProjectType[],
     gitignoreOptions?: GitignoreOptions
@@ -554,23 +568,32 @@ export class ProjectDiscoveryService {
         return projects;
       }
 
-      if (!existsSync(currentPath)) {
-        return projects;
-      }
+      // Dirent types come from readdir itself, so no per-entry stat is needed.
+      // Async reads let sibling scans below overlap their I/O on the libuv thread pool
+      const [entries, stats] = await Promise.all([
+        readdir(currentPath, { withFileTypes: true }),
+        stat(currentPath),
+      ]);
+      const files = entries.filter(entry => entry.isFile() && !this.shouldExclude(join(currentPath, entry.name), excludeMatchers));
 
-      const entries = readdirSync(currentPath, { withFileTypes: true });
-      const files = entries.filter(entry => entry.isFile() && !this.shouldExclude(join(currentPath, entry.name), excludePatterns));
+      // The directory mtime changes whenever a child is added, removed or renamed,
+      // so watching every scanned directory invalidates the cache for new projects
+      watchedPaths.set(currentPath, stats.mtimeMs);
 
       // Check if this directory contains a project
-      const projectInfo = await this.analyzeDirectory(currentPath, files.map(f => f.name));
+      const projectInfo = await this.analyzeDirectory(currentPath, files.map(f => f.name), stats.mtime, watchedPaths);
       if (projectInfo) {
         projects.push(projectInfo);
       }
 
       // Recursively scan subdirectories
       const directories = entries.filter(entry => {
-        const entryPath = join(currentPath, entry.name);
-        return entry.isDirectory() && !this.shouldExcludeDirectory(entryPath, excludePatterns, gitignoreOptions);
+        if (!entry.isDirectory()) {
+          return false;
+        }
+
+        const subPath = join(currentPath, entry.name);
+        return !rootFolders.has(subPath) && !this.shouldExcludeDirectory(subPath, entry.name, excludeMatchers, watchedPaths, gitignoreOptions);
       });
 
       const subDirPromises = directories.map(directory => {
@@ -580,7 +603,9 @@ export class ProjectDiscoveryService {
           subPath,
           currentDepth + 1,
           maxDepth,
-          excludePatterns,
+          excludeMatchers,
+          watchedPaths,
+          rootFolders,
           includePatterns,
           supportedTypes,
           gitignoreOptions
@@ -592,7 +617,11 @@ export class ProjectDiscoveryService {
         projects.push(...subProjects);
       }
     } catch (error) {
-      // Skip directories that can't be read
+      // Skip directories that can't be read; missing ones are skipped silently
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        return projects;
+      }
+
       console.warn(`Warning: Could not read directory ${currentPath}: ${error}`);
     }
 
@@ -602,42 +631,36 @@ export class ProjectDiscoveryService {
   /**
    * Check if path should be excluded based on patterns
    */
-  private shouldExclude(path: string, excludePatterns: string[]): boolean {
+  private shouldExclude(path: string, excludeMatchers: RegExp[]): boolean {
     // Normalize path separators
     const normalizedPath = path.replaceAll('\\', '/');
 
-    for (const pattern of excludePatterns) {
-      // Convert glob pattern to regex and test
-      const regexPattern = this.globToRegex(pattern);
-      const regex = new RegExp(regexPattern);
-
-      if (regex.test(normalizedPath)) {
-        return true;
-      }
-    }
-
-    return false;
+    return excludeMatchers.some(regex => regex.test(normalizedPath));
   }
 
   /**
    * Check if directory path should be excluded based on patterns and gitignore
    */
-  private shouldExcludeDirectory(path: string, excludePatterns: string[], gitignoreOptions?: GitignoreOptions): boolean {
+  private shouldExcludeDirectory(
+    path: string,
+    dirName: string,
+    excludeMatchers: RegExp[],
+    watchedPaths: Map<string, number>,
+    gitignoreOptions?: GitignoreOptions
+  ): boolean {
     // Check default exclusions first
-    const dirName = path.split(sep).pop() || '';
-    const defaultExclusions = ['node_modules', '.git', 'dist', 'build', '.next', '.nuxt', 'coverage', '.nyc_output', 'target', 'bin', 'obj'];
-    if (defaultExclusions.includes(dirName) || dirName.startsWith('.')) {
+    if (DEFAULT_EXCLUDED_DIRECTORIES.has(dirName) || dirName.startsWith('.')) {
       return true;
     }
 
     // First check config exclude patterns
-    if (this.shouldExclude(path, excludePatterns)) {
+    if (this.shouldExclude(path, excludeMatchers)) {
       return true;
     }
 
     // Then check gitignore patterns if enabled
     if (gitignoreOptions?.enabled) {
-      const gitignoreResult = this.checkGitignore(path, gitignoreOptions);
+      const gitignoreResult = this.checkGitignore(path, gitignoreOptions, watchedPaths);
       if (gitignoreResult.excluded) {
         return true;
       }
@@ -645,4 +668,16 @@ export class ProjectDiscoveryService {
 
     return false;
   }
+
+  /**
+   * Record a path's mtime so later cache lookups can detect changes to it
+   */
+  private async watchPath(path: string, watchedPaths: Map<string, number>): Promise<void> {
+    try {
+      const stats = await stat(path);
+      watchedPaths.set(path, stats.mtimeMs);
+    } catch {
+      // Unreadable paths are not watched
+    }
+  }
 }
\ No newline at end of file
@@ -6,7 +6,7 @@ import { existsSync, readdirSync } from 'node:fs';
 import { join, resolve } from 'node:path';
 
 import { CommandResult } from '../types/index.js';
-import { ConfigManager } from './config.js';
+import { ConfigManager, expandHomePath } from './config.js';
 
 export interface ParsedProjectTag {
   fullName: string;
@@ -239,7 +239,7 @@ export class ProjectParser {
    */
   private getDefaultRootFolder(): string {
     const config = this.configManager.getConfig();
-    return config?.defaultRootFolder || join(process.env.HOME || '~', 'code');
+    return expandHomePath(config?.defaultRootFolder || '~/code');
   }
 
   /**
@@ -322,10 +322,8 @@ export class ProjectParser {
    */
   private parseUrlFormat(url: string): CommandResult<ParsedProjectTag> {
     try {
-      let cleanUrl = url.trim();
-
-      // Remove trailing slashes and .git extension
-      cleanUrl = cleanUrl.replace(/\/$/, '').replace(/\.git$/, '');
+      // Already trimmed by parseProjectTag; remove trailing slashes and .git extension
+      const cleanUrl = url.replace(/\/$/, '').replace(/\.git$/, '');
 
       // Extract platform and path from URL
       let platform: 'bitbucket' | 'github' | 'gitlab';
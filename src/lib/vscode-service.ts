@@ -88,18 +88,24 @@ export class VSCodeService {
    */
   public async openProject(project: ProjectInfo): Promise<CommandResult<boolean>> {
     try {
-      if (!this.vscodeInfo) {
-        const detectResult = await this.detectVSCode()
-        if (!detectResult.success) {
-          return {
-            error: 'VS Code not detected',
-            success: false,
-          }
+      // Only the executable is needed to open a known path, so skip the version query
+      const executablePath = await this.resolveVSCodeExecutable()
+      if (!executablePath) {
+        return {
+          error: 'VS Code not detected',
+          success: false,
         }
       }
 
       const config = this.configManager.getConfig()
-      if (!config?.vscode?.enabled) {
+      if (!config) {
+        return {
+          error: this.configManager.getLoadError() || 'Configuration not loaded',
+          success: false,
+        }
+      }
+
+      if (!config.vscode?.enabled) {
         return {
           error: 'VS Code integration is disabled in configuration',
           success: false,
@@ -136,18 +142,24 @@ export class VSCodeService {
    */
   public async openWorkspace(projects: ProjectInfo[], workspaceName?: string): Promise<CommandResult<boolean>> {
     try {
-      if (!this.vscodeInfo) {
-        const detectResult = await this.detectVSCode()
-        if (!detectResult.success) {
-          return {
-            error: 'VS Code not detected',
-            success: false,
-          }
+      // Only the executable is needed to open a known path, so skip the version query
+      const executablePath = await this.resolveVSCodeExecutable()
+      if (!executablePath) {
+        return {
+          error: 'VS Code not detected',
+          success: false,
         }
       }
 
       const config = this.configManager.getConfig()
-      if (!config?.vscode?.enabled) {
+      if (!config) {
+        return {
+          error: this.configManager.getLoadError() || 'Configuration not loaded',
+          success: false,
+        }
+      }
+
+      if (!config.vscode?.enabled) {
         return {
           error: 'VS Code integration is disabled in configuration',
           success: false,
@@ -222,25 +234,22 @@ export class VSCodeService {
     }
 
     return new Promise((resolve, reject) => {
+      // Detach without inherited stdio so the launcher holds no handles on this process
       const vscodeProcess = spawn(this.vscodeInfo!.executablePath!, args, {
         detached: true,
-        stdio: 'inherit',
+        stdio: 'ignore',
       })
 
-      vscodeProcess.on('error', (error) => {
+      vscodeProcess.once('error', (error) => {
         reject(error)
       })
 
-      vscodeProcess.on('exit', (code) => {
-        if (code === 0) {
-          resolve()
-        } else {
-          reject(new Error(`VS Code exited with code ${code}`))
-        }
+      // Resolve once the launcher has started instead of waiting for it to exit,
+      // so the CLI can finish while VS Code is still starting up
+      vscodeProcess.once('spawn', () => {
+        vscodeProcess.unref()
+        resolve()
       })
-
-      // Unref the process so it can run independently
-      vscodeProcess.unref()
     })
   }
 
@@ -407,6 +416,25 @@ export class VSCodeService {
     }
   }
 
+  /**
+   * Resolve the VS Code executable, reusing detection results when available
+   */
+  private async resolveVSCodeExecutable(): Promise<null | string> {
+    if (this.vscodeInfo?.executablePath) {
+      return this.vscodeInfo.executablePath
+    }
+
+    const executablePath = await this.findVSCodeExecutable()
+    if (executablePath) {
+      this.vscodeInfo = {
+        executablePath,
+        isInstalled: true,
+      }
+    }
+
+    return executablePath
+  }
+
   /**
    * Determine if project should be opened in new window
    */
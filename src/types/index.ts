@@ -123,6 +123,18 @@ export interface ProjectDiscoveryOptions {
   maxDepth?: number;
   rootFolders?: string[];
   supportedTypes?: ProjectType[];
+  useCache?: boolean;
+}
+
+export type CachedProjectInfo = Omit<ProjectInfo, 'lastModified' | 'relativePath'> & {
+  lastModified: number;
+};
+
+export interface ProjectCacheEntry {
+  key: string;
+  projects: CachedProjectInfo[];
+  version: number;
+  watchedPaths: Record<string, number>;
 }
 
 export interface ProjectHierarchyNode {
@@ -0,0 +1,47 @@
+import { expect } from 'chai';
+import { homedir, tmpdir } from 'node:os';
+import { join } from 'node:path';
+
+import { expandHomePath, resetHomeDirectoryCache } from '../../src/lib/config.js';
+
+describe('expandHomePath', () => {
+  let originalHome: string | undefined;
+  let home: string;
+
+  before(() => {
+    // Use a home directory no other test has cached
+    originalHome = process.env.HOME;
+    process.env.HOME = join(tmpdir(), 'expand-home-path');
+    resetHomeDirectoryCache();
+    home = homedir();
+  });
+
+  after(() => {
+    process.env.HOME = originalHome;
+    resetHomeDirectoryCache();
+  });
+
+  it('expands ~ to the home directory', () => {
+    expect(expandHomePath('~')).to.equal(home);
+  });
+
+  it('expands ~/ paths', () => {
+    expect(expandHomePath('~/code')).to.equal(join(home, 'code'));
+  });
+
+  it('expands ~\\ paths', () => {
+    expect(expandHomePath('~\\code')).to.equal(join(home, 'code'));
+  });
+
+  it('leaves other users\' home directories unchanged', () => {
+    expect(expandHomePath('~user')).to.equal('~user');
+    expect(expandHomePath('~user/code')).to.equal('~user/code');
+  });
+
+  it('leaves absolute and relative paths unchanged', () => {
+    const absolutePath = join(tmpdir(), 'code');
+
+    expect(expandHomePath(absolutePath)).to.equal(absolutePath);
+    expect(expandHomePath('code/~')).to.equal('code/~');
+  });
+});
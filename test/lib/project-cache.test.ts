@@ -0,0 +1,111 @@
+import { expect } from 'chai';
+import { mkdirSync, mkdtempSync, rmSync, utimesSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+
+import { ProjectCacheManager } from '../../src/lib/project-cache.js';
+import { ProjectInfo } from '../../src/types/index.js';
+
+describe('ProjectCacheManager', () => {
+  let tempDir: string;
+  let projectDir: string;
+  let cacheManager: ProjectCacheManager;
+
+  const project = (): ProjectInfo => ({
+    lastModified: new Date(1_700_000_000_000),
+    name: 'app',
+    path: projectDir,
+    relativePath: 'app',
+    type: 'nodejs',
+  });
+
+  const watch = (...paths: string[]): Map<string, number> => {
+    const watchedPaths = new Map<string, number>();
+    for (const path of paths) {
+      watchedPaths.set(path, 1_700_000_000_000);
+      utimesSync(path, 1_700_000_000, 1_700_000_000);
+    }
+
+    return watchedPaths;
+  };
+
+  beforeEach(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'project-cache-'));
+    projectDir = join(tempDir, 'app');
+    mkdirSync(projectDir);
+    writeFileSync(join(projectDir, 'package.json'), '{}');
+    // Created up front so writing the cache doesn't change the watched temp directory
+    mkdirSync(join(tempDir, 'cache'));
+    cacheManager = new ProjectCacheManager(join(tempDir, 'cache', 'projects-cache.json'));
+  });
+
+  afterEach(() => {
+    rmSync(tempDir, { force: true, recursive: true });
+  });
+
+  it('returns null when nothing is cached', () => {
+    expect(cacheManager.get('key')).to.equal(null);
+  });
+
+  it('returns cached projects while watched paths are unchanged', () => {
+    cacheManager.set('key', [project()], watch(tempDir, projectDir));
+
+    const cached = cacheManager.get('key');
+
+    expect(cached).to.have.length(1);
+    expect(cached![0].path).to.equal(projectDir);
+    expect(cached![0].lastModified).to.be.instanceOf(Date);
+    expect(cached![0].lastModified.getTime()).to.equal(1_700_000_000_000);
+  });
+
+  it('misses for a different key', () => {
+    cacheManager.set('key', [project()], watch(tempDir));
+
+    expect(cacheManager.get('other-key')).to.equal(null);
+  });
+
+  it('misses when a nested watched directory changes', () => {
+    const watchedPaths = watch(tempDir, projectDir);
+    cacheManager.set('key', [project()], watchedPaths);
+
+    utimesSync(projectDir, 1_800_000_000, 1_800_000_000);
+
+    expect(cacheManager.get('key')).to.equal(null);
+  });
+
+  it('misses when a watched package.json changes', () => {
+    const packageJsonPath = join(projectDir, 'package.json');
+    cacheManager.set('key', [project()], watch(tempDir, projectDir, packageJsonPath));
+
+    utimesSync(packageJsonPath, 1_800_000_000, 1_800_000_000);
+
+    expect(cacheManager.get('key')).to.equal(null);
+  });
+
+  it('misses when a watched .gitignore changes', () => {
+    const gitignorePath = join(tempDir, '.gitignore');
+    writeFileSync(gitignorePath, 'node_modules\n');
+    cacheManager.set('key', [project()], watch(tempDir, projectDir, gitignorePath));
+
+    // Rewriting the file in place leaves the directory mtime alone
+    writeFileSync(gitignorePath, '*\n');
+    utimesSync(gitignorePath, 1_800_000_000, 1_800_000_000);
+
+    expect(cacheManager.get('key')).to.equal(null);
+  });
+
+  it('misses when a watched path is removed', () => {
+    cacheManager.set('key', [project()], watch(tempDir, projectDir));
+
+    rmSync(projectDir, { force: true, recursive: true });
+
+    expect(cacheManager.get('key')).to.equal(null);
+  });
+
+  it('misses after the cache is cleared', () => {
+    cacheManager.set('key', [project()], watch(tempDir));
+    cacheManager.clear();
+
+    expect(cacheManager.get('key')).to.equal(null);
+  });
+});
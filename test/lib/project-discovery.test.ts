@@ -0,0 +1,104 @@
+import { expect } from 'chai';
+import { mkdirSync, mkdtempSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+
+import { resetHomeDirectoryCache } from '../../src/lib/config.js';
+import { ProjectDiscoveryService } from '../../src/lib/project-discovery.js';
+import { ProjectDiscoveryOptions } from '../../src/types/index.js';
+
+describe('ProjectDiscoveryService', () => {
+  let tempDir: string;
+  let codeDir: string;
+  let originalHome: string | undefined;
+  let discoveryService: ProjectDiscoveryService;
+
+  const createProject = (...segments: string[]): string => {
+    const projectPath = join(codeDir, ...segments);
+    mkdirSync(projectPath, { recursive: true });
+    writeFileSync(join(projectPath, 'package.json'), '{}');
+    return projectPath;
+  };
+
+  const discover = (rootFolders: string[], maxDepth = 5) => {
+    const options: ProjectDiscoveryOptions = {
+      excludePatterns: [],
+      gitignore: { enabled: false, patternCombinationStrategy: 'merge' },
+      maxDepth,
+      rootFolders,
+      useCache: false,
+    };
+
+    return discoveryService.discoverProjects(options);
+  };
+
+  before(() => {
+    // Keep configuration and cache files out of the real home directory
+    originalHome = process.env.HOME;
+    tempDir = mkdtempSync(join(tmpdir(), 'project-discovery-'));
+    process.env.HOME = join(tempDir, 'home');
+    resetHomeDirectoryCache();
+    discoveryService = new ProjectDiscoveryService();
+  });
+
+  after(() => {
+    process.env.HOME = originalHome;
+    resetHomeDirectoryCache();
+    rmSync(tempDir, { force: true, recursive: true });
+  });
+
+  beforeEach(() => {
+    codeDir = join(tempDir, 'code');
+    mkdirSync(codeDir);
+  });
+
+  afterEach(() => {
+    rmSync(codeDir, { force: true, recursive: true });
+  });
+
+  it('finds projects in a nested root deeper than maxDepth from its parent', async () => {
+    const projectPath = createProject('a', 'b', 'c', 'x', 'proj');
+
+    const projects = await discover([codeDir, join(codeDir, 'a', 'b', 'c')], 3);
+
+    expect(projects.map(project => project.path)).to.deep.equal([projectPath]);
+  });
+
+  it('finds projects in a nested root under an excluded directory', async () => {
+    const projectPath = createProject('build', 'tools', 'proj');
+
+    const projects = await discover([codeDir, join(codeDir, 'build', 'tools')]);
+
+    expect(projects.map(project => project.path)).to.deep.equal([projectPath]);
+  });
+
+  it('reports projects reachable from overlapping roots once', async () => {
+    const projectPath = createProject('a', 'proj');
+
+    const projects = await discover([codeDir, join(codeDir, 'a'), `${codeDir}/`]);
+
+    expect(projects.map(project => project.path)).to.deep.equal([projectPath]);
+  });
+
+  it('scans the directories of a nested root once', async () => {
+    createProject('a', 'proj');
+    createProject('b');
+
+    const service = discoveryService as unknown as { scanDirectory: (...args: unknown[]) => Promise<unknown> };
+    const scanDirectory = service.scanDirectory;
+    const scannedPaths: string[] = [];
+    service.scanDirectory = function (this: unknown, ...args: unknown[]) {
+      scannedPaths.push(args[1] as string);
+      return scanDirectory.apply(this, args);
+    };
+
+    try {
+      await discover([codeDir, join(codeDir, 'a')]);
+    } finally {
+      delete (service as Partial<typeof service>).scanDirectory;
+    }
+
+    expect(scannedPaths).to.have.members([codeDir, join(codeDir, 'a'), join(codeDir, 'a', 'proj'), join(codeDir, 'b')]);
+    expect(scannedPaths).to.have.length(4);
+  });
+});